@@ -53,7 +53,7 @@ print("UTXOs:")
 in_asset = Assets(**{MIN_POLICY: 0})
 for utxo in wallet.utxos:
     print(utxo.dict())
-    in_asset.__root__[MIN_POLICY] += utxo.amount[MIN_POLICY]
+    in_asset = in_asset + Assets(**{MIN_POLICY: utxo.amount[MIN_POLICY]})
 
 print()
 print(f"Swapping {in_asset[MIN_POLICY]} MIN for ADA...")
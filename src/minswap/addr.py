@@ -24,7 +24,7 @@ from dotenv import load_dotenv
 from pyarrow import TimestampScalar
 
 from minswap.models import Address, PoolTransactionReference
-from minswap.utils import BlockfrostBackend, get_utxo, save_timestamp
+from minswap.utils import BlockfrostBackend, get_utxo, month_boundary, save_timestamp
 
 load_dotenv()
 
@@ -61,6 +61,7 @@ FACTORY_POLICY_ID = "13aa2accf2e1561723aa26871e071fdf32c867cff7e7d50ad470d62f"
 FACTORY_ASSET_NAME = "4d494e53574150"
 LP_POLICY_ID = "e4214b7cce62ac6fbba385d164df48e157eae5863521b4b67ca71d86"
 POOL_NFT_POLICY_ID = "0be55d262b29f564998ff81efe21bdc0022621c12f15af08d0f2ddb1"
+FACTORY_UNIT = FACTORY_POLICY_ID + FACTORY_ASSET_NAME
 
 # Pool Own Liquidity Addresses
 POL_MINADA_LBE_LP = Address(
@@ -86,16 +87,15 @@ POL_TRANSACTION_UTXO_CACHE_PATH.mkdir(exist_ok=True, parents=True)
 def _cache_transactions(
     transactions: List[PoolTransactionReference], cache_path: Path
 ) -> List[PoolTransactionReference]:
-    if transactions[0].time.month == transactions[-1].time.month:
-        index = len(transactions)
-    else:
-        for index in range(len(transactions) - 1):
-            if transactions[index].time.month != transactions[index + 1].time.month:
-                index += 1
-                break
-
-    # Convert data to a vaex dataframe
-    df = pandas.DataFrame([d.dict() for d in transactions[:index]])
+    index = month_boundary(transactions, lambda t: t.time)
+
+    # Convert data to a vaex dataframe, building the columns directly
+    df = pandas.DataFrame(
+        {
+            name: [getattr(d, name) for d in transactions[:index]]
+            for name in PoolTransactionReference.__fields__
+        }
+    )
     df["time"] = df.time.astype("datetime64[s]")
 
     # Define the output path
@@ -376,7 +376,10 @@ def cache_pol_transactions(pol_addr: str, max_calls: int = 1000) -> int:
                 tx.extend(thread)
 
             # Store the data if all data for a month is collected
-            while len(tx) > 0 and tx[0].time.month != tx[-1].time.month:
+            while len(tx) > 0 and (tx[0].time.year, tx[0].time.month) != (
+                tx[-1].time.year,
+                tx[-1].time.month,
+            ):
                 logger.debug(
                     "Caching transactions for "
                     + f"{tx[0].time.year}"
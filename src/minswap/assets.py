@@ -225,7 +225,7 @@ def get_asset_info(
     if update_cache or not asset_path.exists():
         return update_asset_info(asset)
     else:
-        return minswap.models.AssetIdentity.parse_file(asset_path)
+        return minswap.models.AssetIdentity.parse_raw_bytes(asset_path.read_bytes())
 
 
 def update_assets(assets: Union[MutableSet[str], minswap.models.Assets]) -> None:
@@ -627,16 +627,16 @@ def cache_transactions(asset_id: str, max_calls: int = 1000) -> int:
                 transactions.extend(thread)
 
             # Store the data if all data for a month is collected
-            while (
-                len(transactions) > 0
-                and transactions[0].block_time.month
-                != transactions[-1].block_time.month
-            ):
-                logger.debug(
-                    "Caching transactions for "
-                    + f"{transactions[0].block_time.year}"
-                    + f"{str(transactions[0].block_time.month).zfill(2)}"
-                )
+            while len(transactions) > 0:
+                first_time = transactions[0].block_time
+                last_time = transactions[-1].block_time
+                if (first_time.year, first_time.month) == (
+                    last_time.year,
+                    last_time.month,
+                ):
+                    break
+
+                logger.debug(f"Caching transactions for {first_time:%Y%m}")
                 transactions = minswap.utils._cache_timestamp_data(
                     transactions, cache_path
                 )
@@ -4,14 +4,16 @@ This module contains common models used throughout minswap-py as well as utility
 functions for converting data types.
 """
 
+import sys
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 import pycardano
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, root_validator, validator
+from pydantic import BaseModel, Field, PrivateAttr, root_validator, validator
 
 from minswap.models import blockfrost_models
 
@@ -27,7 +29,32 @@ class PoolHistory(BaseModel):
     time: datetime
 
 
-class PoolTransactionReference(BaseModel):
+@lru_cache(maxsize=16384)
+def _timestamp_to_datetime(timestamp: int) -> datetime:
+    """Convert a UNIX timestamp to a naive UTC datetime.
+
+    Transactions in the same block share a timestamp, so conversions are cached.
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None)
+
+
+class BaseRaw(BaseModel):
+    """Utility class for models populated from raw Blockfrost JSON."""
+
+    @classmethod
+    def parse_raw_bytes(cls, b: Union[str, bytes]):
+        """Parse and validate a raw JSON payload.
+
+        This skips building an intermediate dictionary in user code, handing the raw
+        payload directly to the model parser.
+
+        Args:
+            b: The raw JSON payload.
+        """
+        return cls.parse_raw(b, content_type="application/json")
+
+
+class PoolTransactionReference(BaseRaw):
     """A reference to a pool transaction state."""
 
     tx_index: int
@@ -35,29 +62,25 @@ class PoolTransactionReference(BaseModel):
     block_height: int
     block_time: datetime
 
-    @root_validator(pre=True)
-    def _validator(cls, values):
-        values["block_time"] = datetime.utcfromtimestamp(values["block_time"])
-
-        return values
+    @validator("block_time", pre=True)
+    def _to_datetime(cls, value):
+        return _timestamp_to_datetime(value)
 
     class Config:  # noqa: D106
         allow_mutation = False
         extra = "forbid"
 
 
-class Transaction(blockfrost_models.TxContent):
+class Transaction(blockfrost_models.TxContent, BaseRaw):
     """Transaction Content."""
 
     block_time: datetime = blockfrost_models.TxContent.__fields__[
         "block_time"
     ]  # type: ignore
 
-    @root_validator(pre=True)
-    def _validator(cls, values):
-        values["block_time"] = datetime.utcfromtimestamp(values["block_time"])
-
-        return values
+    @validator("block_time", pre=True)
+    def _to_datetime(cls, value):
+        return _timestamp_to_datetime(value)
 
 
 class AssetHistoryReference(BaseModel):
@@ -84,6 +107,9 @@ class BaseList(BaseModel):
     def __len__(self):  # noqa
         return len(self.__root__)
 
+    def __contains__(self, item):  # noqa
+        return item in self.__root__
+
 
 class BaseDict(BaseList):
     """Utility class for dict models."""
@@ -111,33 +137,66 @@ class TxIn(BaseModel):
     tx_index: int
 
 
-def _unit_alias(unit: str) -> str:
-    """Rename unit alias.
-
-    If a unit alias is input, it changes it to "unit". Otherwise, passes the value
-    through.
-
-    Arg:
-        unit: The unit alias, or passthrough.
-    """
-    if unit in ["asset"]:
-        return "unit"
+def _sort_units(root: Dict[str, int]) -> Dict[str, int]:
+    """Sort asset units, keeping lovelace at the front."""
+    if len(root) < 2:
+        units = list(root)
     else:
-        return unit
+        units = sorted(root)
+        if "lovelace" in root:
+            units.remove("lovelace")
+            units.insert(0, "lovelace")
+
+    # Units recur across many UTxOs, so intern them for identity-based lookups
+    return {sys.intern(unit): root[unit] for unit in units}
 
 
 class Assets(BaseDict):
-    """Contains all tokens and quantities."""
+    """Contains all tokens and quantities.
+
+    Assets are immutable and hashable, so they can be used as keys for cached
+    calculations. Use arithmetic (i.e. `a + b`) to create modified assets.
+    """
 
     __root__: Dict[str, int]
+    _hash: Optional[int] = PrivateAttr(default=None)
+    _units: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+
+    class Config:  # noqa: D106
+        allow_mutation = False
+        frozen = True
+
+    @classmethod
+    def from_sorted(cls, root: Dict[str, int]) -> "Assets":
+        """Create Assets from units in the caller's intended order, skipping validation.
+
+        This is meant for internal use on trusted data. The `root` dictionary must
+        have integer quantities, and is used as-is without being re-sorted, so the
+        order is not guaranteed to be canonical (i.e. `PoolState` keeps lovelace
+        last for non-ADA pairs).
+
+        Args:
+            root: A dictionary of units and quantities, in the order to keep.
+        """
+        return cls.construct(__root__=root)
+
+    def __hash__(self):  # noqa
+        if self._hash is None:
+            # Equality ignores unit order, so the hash must too
+            self._hash = hash(frozenset(self.__root__.items()))
+
+        return self._hash
 
     def unit(self, index: int = 0) -> str:
         """Units of asset at `index`."""
-        return list(self.keys())[index]
+        if self._units is None:
+            self._units = tuple(self.__root__)
+
+        return self._units[index]
 
     def quantity(self, index: int = 0) -> int:
         """Quantity of the asset at `index`."""
-        return list(self.values())[index]
+        return self.__root__[self.unit(index)]
 
     @root_validator(pre=True)
     def _digest_assets(cls, values):
@@ -147,27 +206,47 @@ class Assets(BaseDict):
             root = {v.unit: v.quantity for v in values["values"]}
         else:
             root = {k: v for k, v in values.items()}
-        root = dict(
-            sorted(root.items(), key=lambda x: "" if x[0] == "lovelace" else x[0])
-        )
 
-        return {"__root__": root}
+        return {"__root__": _sort_units(root)}
 
     def __add__(a, b):
         """Add two assets."""
-        intersection = set(a.keys()) | set(b.keys())
+        result = dict(a.items())
+        for key, value in b.items():
+            result[key] = result.get(key, 0) + value
 
-        result = {key: a[key] + b[key] for key in intersection}
-
-        return Assets(**result)
+        return Assets.from_sorted(_sort_units(result))
 
     def __sub__(a, b):
         """Subtract two assets."""
-        intersection = set(a.keys()) | set(b.keys())
+        result = dict(a.items())
+        for key, value in b.items():
+            result[key] = result.get(key, 0) - value
+
+        return Assets.from_sorted(_sort_units(result))
 
-        result = {key: a[key] - b[key] for key in intersection}
 
-        return Assets(**result)
+def _amount_to_assets(amount: List[dict]) -> Assets:
+    """Convert a Blockfrost list of unit/quantity pairs to Assets.
+
+    Blockfrost usually returns lovelace first followed by sorted units, so the units
+    are only sorted if they arrive out of order. Validation is skipped when
+    constructing the Assets.
+    """
+    root: Dict[str, int] = {}
+    ordered = True
+    previous = ""
+    for item in amount:
+        unit = sys.intern(item["unit"])
+        if unit == "lovelace":
+            ordered = ordered and len(root) == 0
+        elif unit < previous:
+            ordered = False
+        else:
+            previous = unit
+        root[unit] = int(item["quantity"])
+
+    return Assets.from_sorted(root if ordered else _sort_units(root))
 
 
 class OnchainMetadata(blockfrost_models.AssetOnchainMetadataCip25):
@@ -196,7 +275,7 @@ class OnchainMetadataStandard(Enum):
     CIP68v1 = "CIP68v1"
 
 
-class AssetIdentity(blockfrost_models.Asset1):
+class AssetIdentity(blockfrost_models.Asset1, BaseRaw):
     """A blockchain asset."""
 
     @root_validator(pre=True)
@@ -233,11 +312,32 @@ class AddressUtxoContentItem(blockfrost_models.AddressUtxoContentItem):
 
     @validator("amount", pre=True)
     def _to_assets(cls, value):
-        if isinstance(value, list):
-            return Assets(**{i["unit"]: i["quantity"] for i in value})
-        else:
+        # Blockfrost amount lists are the common case, anything else is passed on
+        try:
+            return _amount_to_assets(value)
+        except TypeError:
             return value
 
+    @classmethod
+    def construct_trusted(cls, values: dict) -> "AddressUtxoContentItem":
+        """Create a UTxO from a trusted Blockfrost response without validation.
+
+        If the response does not have the expected shape, this falls back to full
+        validation.
+
+        Args:
+            values: A single UTxO item from a Blockfrost address utxos response.
+        """
+        if not values.keys() >= _UTXO_REQUIRED_FIELDS:
+            return cls.parse_obj(values)
+
+        try:
+            amount = _amount_to_assets(values["amount"])
+        except (KeyError, TypeError, ValueError):
+            return cls.parse_obj(values)
+
+        return cls.construct(**{**values, "amount": amount})
+
     def to_utxo(self) -> pycardano.UTxO:
         """Convert to a pycardano UTxO object."""
         inp = pycardano.TransactionInput.from_primitive([self.tx_hash, self.tx_index])
@@ -250,6 +350,11 @@ class AddressUtxoContentItem(blockfrost_models.AddressUtxoContentItem):
         return pycardano.UTxO(inp, out)
 
 
+_UTXO_REQUIRED_FIELDS = {
+    name for name, field in AddressUtxoContentItem.__fields__.items() if field.required
+}
+
+
 class AddressUtxoContent(blockfrost_models.AddressUtxoContent, BaseList):
     """An address UTxO list of items."""
 
@@ -276,9 +381,10 @@ class Input(blockfrost_models.Input):
 
     @validator("amount", pre=True)
     def _to_assets(cls, value):
-        if isinstance(value, list):
-            return Assets(**{i["unit"]: i["quantity"] for i in value})
-        else:
+        # Blockfrost amount lists are the common case, anything else is passed on
+        try:
+            return _amount_to_assets(value)
+        except TypeError:
             return value
 
 
@@ -298,13 +404,14 @@ class Output(blockfrost_models.Output):
 
     @validator("amount", pre=True)
     def _to_assets(cls, value):
-        if isinstance(value, list):
-            return Assets(**{i["unit"]: i["quantity"] for i in value})
-        else:
+        # Blockfrost amount lists are the common case, anything else is passed on
+        try:
+            return _amount_to_assets(value)
+        except TypeError:
             return value
 
 
-class TxContentUtxo(blockfrost_models.TxContentUtxo):
+class TxContentUtxo(blockfrost_models.TxContentUtxo, BaseRaw):
     """A Transaction, containing all inputs and outputs."""
 
     inputs: List[Input]
@@ -330,36 +437,46 @@ class Address(BaseModel):
     def translate_address(cls, values):  # noqa: D102
         assert "bech32" in values
 
-        values["address"] = pycardano.Address.decode(values["bech32"])
+        (
+            values["address"],
+            values["payment"],
+            values["stake"],
+        ) = _decode_address(values["bech32"])
 
-        if values["address"].staking_part is not None:
-            values["stake"] = pycardano.Address(
-                staking_part=values["address"].staking_part
-            )
-        else:
-            values["stake"] = None
+        return values
 
-        if values["address"].payment_part is not None:
-            values["payment"] = pycardano.Address(
-                payment_part=values["address"].payment_part
-            )
-        else:
-            values["payment"] = None
 
-        return values
+@lru_cache(maxsize=2048)
+def _decode_address(
+    bech32: str,
+) -> Tuple[pycardano.Address, Optional[pycardano.Address], Optional[pycardano.Address]]:
+    """Decode a bech32 address into its full, payment, and stake addresses."""
+    address = pycardano.Address.decode(bech32)
+
+    if address.payment_part is not None:
+        payment = pycardano.Address(payment_part=address.payment_part)
+    else:
+        payment = None
+
+    if address.staking_part is not None:
+        stake = pycardano.Address(staking_part=address.staking_part)
+    else:
+        stake = None
+
+    return address, payment, stake
 
 
 ORDER_SCRIPT: pycardano.PlutusV1Script = pycardano.PlutusV1Script(
     bytes.fromhex(
         "59014c01000032323232323232322223232325333009300e30070021323233533300b33"
-        + "70e9000180480109118011bae30100031225001232533300d3300e22533301300114a02a666"
-        + "01e66ebcc04800400c5288980118070009bac3010300c300c300c300c300c300c300c007149"
-        + "858dd48008b18060009baa300c300b3754601860166ea80184ccccc0288894ccc0400044008"
-        + "4c8c94ccc038cd4ccc038c04cc030008488c008dd718098018912800919b8f0014891ce1317"
-        + "b152faac13426e6a83e06ff88a4d62cce3c1634ab0a5ec133090014a0266008444a00226600"
-        + "a446004602600a601a00626600a008601a006601e0026ea8c03cc038dd5180798071baa300f"
-        + "300b300e3754601e00244a0026eb0c03000c92616300a001375400660106ea8c024c020dd50"
-        + "00aab9d5744ae688c8c0088cc0080080048c0088cc00800800555cf2ba15573e6e1d200201"
+        "70e9000180480109118011bae30100031225001232533300d3300e22533301300114a02a666"
+        "01e66ebcc04800400c5288980118070009bac3010300c300c300c300c300c300c300c007149"
+        "858dd48008b18060009baa300c300b3754601860166ea80184ccccc0288894ccc0400044008"
+        "4c8c94ccc038cd4ccc038c04cc030008488c008dd718098018912800919b8f0014891ce1317"
+        "b152faac13426e6a83e06ff88a4d62cce3c1634ab0a5ec133090014a0266008444a00226600"
+        "a446004602600a601a00626600a008601a006601e0026ea8c03cc038dd5180798071baa300f"
+        "300b300e3754601e00244a0026eb0c03000c92616300a001375400660106ea8c024c020dd50"
+        "00aab9d5744ae688c8c0088cc0080080048c0088cc00800800555cf2ba15573e6e1d200201"
     )
 )
 
@@ -414,6 +531,12 @@ class PlutusFullAddress(pycardano.PlutusData):
         )
 
 
+@lru_cache(maxsize=8192)
+def _split_unit(unit: str) -> Tuple[bytes, bytes]:
+    """Split a unit into policy id and asset name bytes."""
+    return bytes.fromhex(unit[:56]), bytes.fromhex(unit[56:])
+
+
 @dataclass
 class AssetClass(pycardano.PlutusData):
     """An asset class. Separates out token policy and asset name."""
@@ -424,38 +547,38 @@ class AssetClass(pycardano.PlutusData):
     @classmethod
     def from_assets(cls, asset: Assets):
         """Parse an Assets object into an AssetClass object."""
-        assert len(asset) == 1
+        return _asset_class_quantity(asset)[0]
 
-        if asset.unit() == "lovelace":
-            return AssetClass(
-                policy=b"",
-                asset_name=b"",
-            )
-        else:
-            return AssetClass(
-                policy=bytes.fromhex(asset.unit()[:56]),
-                asset_name=bytes.fromhex(asset.unit()[56:]),
-            )
+
+def _asset_class_quantity(asset: Assets) -> Tuple[AssetClass, int]:
+    """Split a single asset into its AssetClass and quantity."""
+    assert len(asset) == 1
+
+    unit, quantity = next(iter(asset.items()))
+    if unit == "lovelace":
+        return AssetClass(policy=b"", asset_name=b""), quantity
+    else:
+        policy, asset_name = _split_unit(unit)
+        return AssetClass(policy=policy, asset_name=asset_name), quantity
 
 
 def asset_to_value(assets: Assets) -> pycardano.Value:
     """Convert an Assets object to a pycardano.Value."""
     coin = assets["lovelace"]
-    cnts = {}
+
+    # Pure ADA amounts are the most common case
+    num_tokens = len(assets) - 1 if "lovelace" in assets else len(assets)
+    if num_tokens == 0:
+        return pycardano.Value.from_primitive([coin])
+
+    cnts: Dict[bytes, Dict[bytes, int]] = {}
     for unit, quantity in assets.items():
         if unit == "lovelace":
             continue
-        policy = bytes.fromhex(unit[:56])
-        asset_name = bytes.fromhex(unit[56:])
-        if policy not in cnts:
-            cnts[policy] = {asset_name: quantity}
-        else:
-            cnts[policy][asset_name] = quantity
+        policy, asset_name = _split_unit(unit)
+        cnts.setdefault(policy, {})[asset_name] = quantity
 
-    if len(cnts) == 0:
-        return pycardano.Value.from_primitive([coin])
-    else:
-        return pycardano.Value.from_primitive([coin, cnts])
+    return pycardano.Value.from_primitive([coin, cnts])
 
 
 @dataclass
@@ -469,11 +592,7 @@ class SwapExactIn(pycardano.PlutusData):
     @classmethod
     def from_assets(cls, asset: Assets):
         """Parse an Assets object into a SwapExactIn datum."""
-        assert len(asset) == 1
-
-        return SwapExactIn(
-            desired_coin=AssetClass.from_assets(asset), minimum_receive=asset.quantity()
-        )
+        return cls(*_asset_class_quantity(asset))
 
 
 @dataclass
@@ -487,12 +606,7 @@ class SwapExactOut(pycardano.PlutusData):
     @classmethod
     def from_assets(cls, asset: Assets):
         """Parse an Assets object into a SwapExactOut datum."""
-        assert len(asset) == 1
-
-        return SwapExactOut(
-            desired_coin=AssetClass.from_assets(asset),
-            expected_receive=asset.quantity(),
-        )
+        return cls(*_asset_class_quantity(asset))
 
 
 @dataclass
@@ -523,12 +637,7 @@ class ZapIn(pycardano.PlutusData):
     @classmethod
     def from_assets(cls, asset: Assets):
         """Parse an Assets object into a SwapExactOut datum."""
-        assert len(asset) == 1
-
-        return ZapIn(
-            desired_coin=AssetClass.from_assets(asset),
-            minimum_receive=asset.quantity(),
-        )
+        return cls(*_asset_class_quantity(asset))
 
 
 @dataclass
@@ -6,18 +6,18 @@ import logging
 import math
 from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import List, Optional, Tuple, Union
+from functools import lru_cache
+from multiprocessing import cpu_count
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, root_validator
+import numpy
+from pydantic import BaseModel, PrivateAttr, root_validator
 
 from minswap import addr
-from minswap.assets import naturalize_assets
+from minswap.assets import asset_decimals, get_asset_info
 from minswap.models import (
-    AddressUtxoContent,
     AddressUtxoContentItem,
-    AssetIdentity,
     Assets,
-    AssetTransaction,
     Output,
     PoolDatum,
     TxContentUtxo,
@@ -27,6 +27,13 @@ from minswap.utils import BlockfrostBackend
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Blockfrost returns at most 100 items per page
+UTXO_PAGE_SIZE = 100
+UTXO_PAGE_BATCH = cpu_count()
+
+# Shared across calls so that polling does not start and join threads every time
+_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="minswap-pools")
+
 
 class InvalidPool(ValueError):
     """Error thrown when a pool UTXO cannot be validated.
@@ -47,27 +54,34 @@ def check_valid_pool_output(utxo: Union[AddressUtxoContentItem, Output]):
         ValueError: No factory token found in utxos.
     """
     # Check to make sure the pool has 1 factory token
-    for asset in utxo.amount:
-        has_factory: bool = (
-            f"{addr.FACTORY_POLICY_ID}{addr.FACTORY_ASSET_NAME}" == asset
-        )
-        if has_factory:
-            break
-    if not has_factory:
+    if not is_valid_pool_output(utxo):
         message = "Pool must have 1 factory token."
         logger.debug(message)
-        logger.debug(f"asset.unit={asset}")
-        logger.debug(f"factory={addr.FACTORY_POLICY_ID}{addr.FACTORY_ASSET_NAME}")
+        logger.debug(f"assets={list(utxo.amount)}")
+        logger.debug(f"factory={addr.FACTORY_UNIT}")
         raise InvalidPool(message)
 
 
-def is_valid_pool_output(utxo: AddressUtxoContentItem):
+def is_valid_pool_output(utxo: Union[AddressUtxoContentItem, Output]) -> bool:
     """Determine if a utxo contains a pool identifier."""
-    try:
-        check_valid_pool_output(utxo)
-        return True
-    except InvalidPool:
-        return False
+    return addr.FACTORY_UNIT in utxo.amount
+
+
+@lru_cache(maxsize=4096)
+def _get_asset_name(unit: str) -> str:
+    """Human readable name of an asset, cached across pools.
+
+    Asset names are immutable, so they are also persisted to the asset info cache on
+    disk and only fetched from Blockfrost the first time an asset is seen.
+    """
+    logger.debug(f"_get_asset_info: {unit}")
+    if unit == "lovelace":
+        return "lovelace"
+    info = get_asset_info(unit)
+    if info is None or info.asset_name is None:
+        return unit
+
+    return bytes.fromhex(info.asset_name).decode()
 
 
 class PoolState(BaseModel):
@@ -82,6 +96,11 @@ class PoolState(BaseModel):
     raw_datum: Optional[str]
     raw_lp_total: Optional[int]
     raw_root_k_last: Optional[int]
+    _id: Optional[str] = PrivateAttr(default=None)
+    _lp_token: Optional[str] = PrivateAttr(default=None)
+    _price: Optional[Tuple[Decimal, Decimal]] = PrivateAttr(default=None)
+    _tvl: Optional[Decimal] = PrivateAttr(default=None)
+    _pool_datum: Optional[PoolDatum] = PrivateAttr(default=None)
 
     class Config:  # noqa: D106
         allow_mutation = False
@@ -89,54 +108,56 @@ class PoolState(BaseModel):
 
     @root_validator(pre=True)
     def translate_address(cls, values):  # noqa: D102
-        assets = values["assets"]
+        # Classify the pool assets in a single pass, keyed on the 56 character policy
+        pool_nfts: Dict[str, int] = {}
+        minswap_nfts: Dict[str, int] = {}
+        assets: Dict[str, int] = {}
+        policies = {
+            addr.POOL_NFT_POLICY_ID: pool_nfts,
+            addr.FACTORY_POLICY_ID: minswap_nfts,
+        }
+        for unit, quantity in values["assets"].items():
+            policies.get(unit[:56], assets)[unit] = quantity
 
         # Find the NFT that assigns the pool a unique id
         if "pool_nft" in values:
-            assert addr.POOL_NFT_POLICY_ID in [p[:56] for p in values["pool_nft"]]
+            assert any(
+                p.startswith(addr.POOL_NFT_POLICY_ID) for p in values["pool_nft"]
+            )
             pool_nft = Assets(
                 **{key: value for key, value in values["pool_nft"].items()}
             )
         else:
-            nfts = [
-                asset for asset in assets if asset.startswith(addr.POOL_NFT_POLICY_ID)
-            ]
-            if len(nfts) != 1:
+            if len(pool_nfts) != 1:
                 raise ValueError("A pool must have one pool NFT token.")
-            pool_nft = Assets(**{nfts[0]: assets.__root__.pop(nfts[0])})
+            pool_nft = Assets.from_sorted(pool_nfts)
             values["pool_nft"] = pool_nft
 
         # Find the Minswap NFT token
         if "minswap_nft" in values:
-            assert addr.FACTORY_POLICY_ID in [p[:56] for p in values["minswap_nft"]]
+            assert any(
+                p.startswith(addr.FACTORY_POLICY_ID) for p in values["minswap_nft"]
+            )
         else:
-            nfts = [
-                asset for asset in assets if asset.startswith(addr.FACTORY_POLICY_ID)
-            ]
-            if len(nfts) != 1:
+            if len(minswap_nfts) != 1:
                 raise ValueError("A pool must have one Minswap NFT token.")
-            minswap_nft = Assets(**{nfts[0]: assets.__root__.pop(nfts[0])})
-            values["minswap_nft"] = minswap_nft
+            values["minswap_nft"] = Assets.from_sorted(minswap_nfts)
 
         # Sometimes LP tokens for the pool are in the pool...so remove them
         pool_id = pool_nft.unit()[len(addr.POOL_NFT_POLICY_ID) :]
-        lps = [asset for asset in assets if asset.endswith(pool_id)]
-        for lp in lps:
-            assets.__root__.pop(lp)
-
-        non_ada_assets = [a for a in assets if a != "lovelace"]
+        assets.pop(addr.LP_POLICY_ID + pool_id, None)
 
         if len(assets) == 2:
             # ADA pair
-            assert len(non_ada_assets) == 1, "Pool must only have 1 non-ADA asset."
+            assert "lovelace" in assets, "Pool must only have 1 non-ADA asset."
 
         elif len(assets) == 3:
             # Non-ADA pair
-            assert len(non_ada_assets) == 2, "Pool must only have 2 non-ADA assets."
+            assert "lovelace" in assets, "Pool must only have 2 non-ADA assets."
 
-            # Send the ADA token to the end
-            values["assets"].__root__["lovelace"] = values["assets"].__root__.pop(
-                "lovelace"
+            # Send the ADA token to the end, keeping the other assets in order
+            assets = dict(
+                sorted(assets.items(), key=lambda item: item[0] == "lovelace")
             )
 
         else:
@@ -144,17 +165,26 @@ class PoolState(BaseModel):
                 "Pool must have 2 or 3 assets except factor, NFT, and LP tokens."
             )
 
+        # Skip validation to preserve the ordering of the assets
+        values["assets"] = Assets.from_sorted(assets)
+
         return values
 
     @property
     def id(self) -> str:
         """Pool id."""
-        return self.pool_nft.unit()[len(addr.POOL_NFT_POLICY_ID) :]
+        if self._id is None:
+            self._id = self.pool_nft.unit()[len(addr.POOL_NFT_POLICY_ID) :]
+
+        return self._id
 
     @property
     def lp_token(self) -> str:
         """Pool liquidity provider token."""
-        return f"{addr.LP_POLICY_ID}{self.id}"
+        if self._lp_token is None:
+            self._lp_token = f"{addr.LP_POLICY_ID}{self.id}"
+
+        return self._lp_token
 
     @property
     def unit_a(self) -> str:
@@ -177,11 +207,7 @@ class PoolState(BaseModel):
         return self.assets.quantity(1)
 
     def _get_asset_name(self, value: str) -> str:
-        logger.debug(f"_get_asset_info: {value}")
-        if value == "lovelace":
-            return "lovelace"
-        info = BlockfrostBackend.api().asset(value, return_type="json")
-        return bytes.fromhex(AssetIdentity.parse_obj(info).asset_name).decode()
+        return _get_asset_name(value)
 
     @property
     def asset_a_name(self) -> str:
@@ -198,18 +224,41 @@ class PoolState(BaseModel):
         """Price of assets.
 
         Returns:
-            A `Tuple[Decimal, Decimal] where the first `Decimal` is the price to buy
+            A `Tuple[Decimal, Decimal]` where the first `Decimal` is the price to buy
                 1 of token B in units of token A, and the second `Decimal` is the price
                 to buy 1 of token A in units of token B.
         """
-        nat_assets = naturalize_assets(self.assets)
+        if self._price is None:
+            scale_a = 10 ** asset_decimals(self.unit_a)
+            scale_b = 10 ** asset_decimals(self.unit_b)
 
-        prices = (
-            (nat_assets[self.unit_a] / nat_assets[self.unit_b]),
-            (nat_assets[self.unit_b] / nat_assets[self.unit_a]),
-        )
+            # Scale the reserves to a common denominator so each price is one division
+            reserve_a = Decimal(self.reserve_a * scale_b)
+            reserve_b = Decimal(self.reserve_b * scale_a)
+
+            self._price = (reserve_a / reserve_b, reserve_b / reserve_a)
 
-        return prices
+        return self._price
+
+    @property
+    def price_float(self) -> Tuple[float, float]:
+        """Price of assets as floats.
+
+        This is a faster alternative to `price` for when float precision is sufficient.
+
+        Returns:
+            A `Tuple[float, float]` where the first `float` is the price to buy 1 of
+                token B in units of token A, and the second `float` is the price to buy
+                1 of token A in units of token B.
+        """
+        scale_a = 10 ** asset_decimals(self.unit_a)
+        scale_b = 10 ** asset_decimals(self.unit_b)
+
+        # Integer true division rounds once, so no precision is lost before the end
+        return (
+            (self.reserve_a * scale_b) / (self.reserve_b * scale_a),
+            (self.reserve_b * scale_a) / (self.reserve_a * scale_b),
+        )
 
     @property
     def tvl(self) -> Decimal:
@@ -221,21 +270,26 @@ class PoolState(BaseModel):
         if self.unit_a != "lovelace":
             raise NotImplementedError("tvl for non-ADA pools is not implemented.")
 
-        tvl = 2 * (Decimal(self.reserve_a) / Decimal(10**6)).quantize(
-            1 / Decimal(10**6)
-        )
+        if self._tvl is None:
+            self._tvl = 2 * (Decimal(self.reserve_a) / Decimal(10**6)).quantize(
+                1 / Decimal(10**6)
+            )
 
-        return tvl
+        return self._tvl
 
     @property
     def pool_datum(self) -> PoolDatum:
         """The pool state datum."""
-        if not self.raw_datum:
-            self.raw_datum = BlockfrostBackend.api().script_datum(
-                self.datum_hash, return_type="json"
-            )["json_value"]
+        if self._pool_datum is None:
+            raw_datum = self.raw_datum
+            if not raw_datum:
+                raw_datum = BlockfrostBackend.api().script_datum(
+                    self.datum_hash, return_type="json"
+                )["json_value"]
+
+            self._pool_datum = PoolDatum.from_dict(raw_datum)
 
-        return PoolDatum.from_dict(self.raw_datum)
+        return self._pool_datum
 
     @property
     def volume_fee(self) -> int:
@@ -251,7 +305,7 @@ class PoolState(BaseModel):
     def lp_total(self) -> int:
         """The LP liquidity constant."""
         if not self.raw_lp_total:
-            self.raw_lp_total = self.pool_datum.total_liquidity
+            return self.pool_datum.total_liquidity
 
         return self.raw_lp_total
 
@@ -259,7 +313,7 @@ class PoolState(BaseModel):
     def root_k_last(self) -> int:
         """The last fee switch checkin."""
         if not self.raw_root_k_last:
-            self.raw_root_k_last = self.pool_datum.root_k_last
+            return self.pool_datum.root_k_last
 
         return self.raw_root_k_last
 
@@ -274,34 +328,83 @@ class PoolState(BaseModel):
                 and the second value is the price impact ratio.
         """
         assert len(asset) == 1, "Asset should only have one token."
-        assert asset.unit() in [
-            self.unit_a,
-            self.unit_b,
-        ], f"Asset {asset.unit} is invalid for pool {self.unit_a}-{self.unit_b}"
-
-        if asset.unit() == self.unit_a:
+        unit_in, quantity_in = asset.unit(), asset.quantity()
+        unit_a, unit_b = self.unit_a, self.unit_b
+        assert unit_in in (
+            unit_a,
+            unit_b,
+        ), f"Asset {unit_in} is invalid for pool {unit_a}-{unit_b}"
+
+        if unit_in == unit_a:
             reserve_in, reserve_out = self.reserve_a, self.reserve_b
-            unit_out = self.unit_b
+            unit_out = unit_b
         else:
             reserve_in, reserve_out = self.reserve_b, self.reserve_a
-            unit_out = self.unit_a
+            unit_out = unit_a
 
         # Calculate the amount out
         fee_modifier = 10000 - self.volume_fee
-        numerator: int = asset.quantity() * fee_modifier * reserve_out
-        denominator: int = asset.quantity() * fee_modifier + reserve_in * 10000
+        quantity_fee: int = quantity_in * fee_modifier
+        numerator: int = quantity_fee * reserve_out
+        denominator: int = quantity_fee + reserve_in * 10000
         amount_out = Assets(**{unit_out: numerator // denominator})
 
         # Calculate the price impact
         price_numerator: int = (
-            reserve_out * asset.quantity() * denominator * fee_modifier
+            reserve_out * quantity_in * denominator * fee_modifier
             - numerator * reserve_in * 10000
         )
-        price_denominator: int = reserve_out * asset.quantity() * denominator * 10000
+        price_denominator: int = reserve_out * quantity_in * denominator * 10000
         price_impact: float = price_numerator / price_denominator
 
         return amount_out, price_impact
 
+    def get_amount_out_batch(
+        self, unit: str, quantities: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Get the output asset amounts for many input amounts of one asset.
+
+        This is the vectorized equivalent of calling `get_amount_out` for each
+        quantity, which is useful when sweeping input amounts to build a slippage curve.
+
+        Args:
+            unit: The unit of the input asset.
+            quantities: An array of input asset quantities.
+
+        Returns:
+            A tuple of arrays where the first array contains the estimated quantities of
+                the asset returned from each swap and the second array contains the
+                price impact ratios.
+        """
+        assert unit in (
+            self.unit_a,
+            self.unit_b,
+        ), f"Asset {unit} is invalid for pool {self.unit_a}-{self.unit_b}"
+
+        if unit == self.unit_a:
+            reserve_in, reserve_out = self.reserve_a, self.reserve_b
+        else:
+            reserve_in, reserve_out = self.reserve_b, self.reserve_a
+
+        # Use int64 math when it cannot overflow, otherwise fall back to Python ints
+        fee_modifier = 10000 - self.volume_fee
+        quantities = numpy.asarray(quantities)
+        max_quantity_fee = int(quantities.max(initial=1)) * fee_modifier
+        if max_quantity_fee * reserve_out < 2**62 and reserve_in * 10000 < 2**62:
+            quantities = quantities.astype(numpy.int64)
+        else:
+            quantities = quantities.astype(object)
+
+        # Calculate the amount out
+        quantity_fee = quantities * fee_modifier
+        denominator = quantity_fee + reserve_in * 10000
+        amount_out = quantity_fee * reserve_out // denominator
+
+        # Calculate the price impact, which reduces to a ratio of the terms above
+        price_impact = (fee_modifier / 10000) * (quantity_fee / denominator)
+
+        return amount_out, price_impact.astype(numpy.float64)
+
     def get_amount_in(self, asset: Assets) -> Tuple[Assets, float]:
         """Get the input asset amount given a desired output asset amount.
 
@@ -312,27 +415,29 @@ class PoolState(BaseModel):
             The estimated asset needed for input in the swap.
         """
         assert len(asset) == 1, "Asset should only have one token."
-        assert asset.unit() in [
-            self.unit_a,
-            self.unit_b,
-        ], f"Asset {asset.unit} is invalid for pool {self.unit_a}-{self.unit_b}"
-        if asset.unit == self.unit_b:
+        unit_out, quantity_out = asset.unit(), asset.quantity()
+        unit_a, unit_b = self.unit_a, self.unit_b
+        assert unit_out in (
+            unit_a,
+            unit_b,
+        ), f"Asset {unit_out} is invalid for pool {unit_a}-{unit_b}"
+        if unit_out == unit_b:
             reserve_in, reserve_out = self.reserve_a, self.reserve_b
-            unit_out = self.unit_a
+            unit_in = unit_a
         else:
             reserve_in, reserve_out = self.reserve_b, self.reserve_a
-            unit_out = self.unit_b
+            unit_in = unit_b
 
         # Estimate the required input
         fee_modifier = 10000 - self.volume_fee
-        numerator: int = asset.quantity() * 10000 * reserve_in
-        denominator: int = (reserve_out - asset.quantity()) * fee_modifier
-        amount_in = Assets(unit=unit_out, quantity=numerator // denominator)
+        numerator: int = quantity_out * 10000 * reserve_in
+        denominator: int = (reserve_out - quantity_out) * fee_modifier
+        amount_in = Assets(**{unit_in: numerator // denominator})
 
         # Estimate the price impact
         price_numerator: int = (
             reserve_out * numerator * fee_modifier
-            - asset.quantity() * denominator * reserve_in * 10000
+            - quantity_out * denominator * reserve_in * 10000
         )
         price_denominator: int = reserve_out * numerator * 10000
         price_impact: float = price_numerator / price_denominator
@@ -349,23 +454,23 @@ class PoolState(BaseModel):
             The estimated amount of lp received for the zap in quantity.
         """
         assert len(asset) == 1, "Asset should only have one token."
-        assert asset.unit() in [
-            self.unit_a,
-            self.unit_b,
-        ], f"Asset {asset.unit} is invalid for pool {self.unit_a}-{self.unit_b}"
-        if asset.unit() == self.unit_a:
+        unit_in, quantity = asset.unit(), asset.quantity()
+        unit_a, unit_b = self.unit_a, self.unit_b
+        assert unit_in in (
+            unit_a,
+            unit_b,
+        ), f"Asset {unit_in} is invalid for pool {unit_a}-{unit_b}"
+        if unit_in == unit_a:
             reserve_in, reserve_out = self.reserve_a, self.reserve_b
         else:
             reserve_in, reserve_out = self.reserve_b, self.reserve_a
 
+        # Use an integer square root, since the discriminant can exceed float precision
         quantity_in = (
-            math.sqrt(
-                1997**2 * reserve_in**2
-                + 4 * 997 * 1000 * asset.quantity() * reserve_in
-            )
+            math.isqrt(1997**2 * reserve_in**2 + 4 * 997 * 1000 * quantity * reserve_in)
             - 1997 * reserve_in
-        ) / (2 * 997)
-        asset_in = Assets(**{asset.unit(): quantity_in})
+        ) // (2 * 997)
+        asset_in = Assets(**{unit_in: quantity_in})
 
         asset_out, price_impact = self.get_amount_out(asset_in)
 
@@ -373,22 +478,76 @@ class PoolState(BaseModel):
         # https://github.com/minswap/blockfrost-adapter/pull/7/files#r1279439474
         total_lp = self.lp_total
 
-        quantity_lp = (asset_out.quantity() * total_lp) / (
-            reserve_out - asset_out.quantity()
-        )
+        quantity_out = asset_out.quantity()
+        quantity_lp = (quantity_out * total_lp) // (reserve_out - quantity_out)
 
-        lp_out = Assets(**{self.lp_token: int(quantity_lp)})
+        lp_out = Assets(**{self.lp_token: quantity_lp})
 
         # TODO: Make sure price impact is correct
         return lp_out, price_impact
 
 
-def get_pool_addresses() -> list[str]:
-    """bech32 pool addresses."""
+@lru_cache(maxsize=1)
+def get_pool_addresses() -> FrozenSet[str]:
+    """bech32 pool addresses.
+
+    The addresses are fetched once and cached. Call `get_pool_addresses.cache_clear()`
+    to fetch them again.
+    """
     response = BlockfrostBackend.api().asset_addresses(
-        addr.FACTORY_POLICY_ID + addr.FACTORY_ASSET_NAME, return_type="json"
+        addr.FACTORY_UNIT, return_type="json"
+    )
+    return frozenset(pool["address"] for pool in response)
+
+
+def _get_utxo_page(address: str, page: int) -> List[dict]:
+    """Get a single page of UTxOs at an address."""
+    return BlockfrostBackend.api().address_utxos(
+        address,
+        count=UTXO_PAGE_SIZE,
+        page=page,
+        order="desc",
+        return_type="json",
     )
-    return [pool["address"] for pool in response]
+
+
+def _iter_address_utxos(
+    addresses: Iterable[str], executor: ThreadPoolExecutor
+) -> Iterator[AddressUtxoContentItem]:
+    """Iterate over all UTxOs at a set of addresses.
+
+    The first page of every address is requested in parallel. Only addresses that
+    returned a full page have further pages requested, in parallel batches, so that
+    addresses with few UTxOs cost a single call. Each page is parsed as soon as it
+    arrives rather than after all pages have been gathered.
+
+    Args:
+        addresses: The bech32 addresses.
+        executor: Executor used to request pages in parallel.
+    """
+    requests = [(address, 1) for address in addresses]
+    while len(requests) > 0:
+        # Requests are only submitted from here, so pages never wait on each other
+        pages = executor.map(_get_utxo_page, *zip(*requests))
+
+        last_full: Dict[str, int] = {}
+        finished = set()
+        for (address, page), utxos in zip(requests, pages):
+            if len(utxos) < UTXO_PAGE_SIZE:
+                finished.add(address)
+            else:
+                last_full[address] = max(page, last_full.get(address, 0))
+
+            # Blockfrost responses are trusted, so skip validation where possible
+            for utxo in utxos:
+                yield AddressUtxoContentItem.construct_trusted(utxo)
+
+        requests = [
+            (address, next_page)
+            for address, page in last_full.items()
+            if address not in finished
+            for next_page in range(page + 1, page + 1 + UTXO_PAGE_BATCH)
+        ]
 
 
 def get_pools(
@@ -403,29 +562,10 @@ def get_pools(
     Returns:
         A list of pools, and a list of non-pool UTxOs (if specified)
     """
-    utxos_raw = []
-
-    with ThreadPoolExecutor() as executor:
-        pool_addresses = get_pool_addresses()
-
-        threads = executor.map(
-            lambda x: BlockfrostBackend.api().address_utxos(
-                x,
-                gather_pages=True,
-                order="desc",
-                return_type="json",
-            ),
-            pool_addresses,
-        )
-        for pool_addr in threads:
-            utxos_raw.extend(pool_addr)
-
-    utxos = AddressUtxoContent.parse_obj(utxos_raw)
-
     pools: List[PoolState] = []
     non_pools: List[AddressUtxoContentItem] = []
 
-    for utxo in utxos:
+    for utxo in _iter_address_utxos(get_pool_addresses(), _EXECUTOR):
         if is_valid_pool_output(utxo):
             pools.append(
                 PoolState(
@@ -435,7 +575,7 @@ def get_pools(
                     datum_hash=utxo.data_hash,
                 )
             )
-        else:
+        elif return_non_pools:
             non_pools.append(utxo)
 
     if return_non_pools:
@@ -444,6 +584,24 @@ def get_pools(
         return pools
 
 
+def resolve_pool_names(pools: List[PoolState]) -> Dict[str, str]:
+    """Get the names of all assets in a list of pools.
+
+    Each unique asset is only looked up once, and lookups are made in parallel. The
+    names are cached, so subsequent calls to `asset_a_name` and `asset_b_name` on the
+    pools do not make additional calls to Blockfrost.
+
+    Args:
+        pools: A list of pools.
+
+    Returns:
+        A dictionary mapping asset units to asset names.
+    """
+    units = {unit for pool in pools for unit in (pool.unit_a, pool.unit_b)}
+
+    return dict(zip(units, _EXECUTOR.map(_get_asset_name, units)))
+
+
 def get_pool_in_tx(tx_hash: str) -> Optional[PoolState]:
     """Get the pool state from a transaction.
 
@@ -488,13 +646,26 @@ def get_pool_by_id(pool_id: str) -> Optional[PoolState]:
         A `PoolState` if the pool can be found, and `None` otherwise.
     """
     nft = f"{addr.POOL_NFT_POLICY_ID}{pool_id}"
-    nft_txs = BlockfrostBackend.api().asset_transactions(
-        nft, count=1, page=1, order="desc", return_type="json"
+    nft_addresses = BlockfrostBackend.api().asset_addresses(nft, return_type="json")
+
+    if len(nft_addresses) == 0:
+        return None
+
+    # The pool NFT is unique, so the only UTxO holding it is the current pool state
+    nft_utxos = BlockfrostBackend.api().address_utxos_asset(
+        nft_addresses[0]["address"], nft, return_type="json"
     )
 
-    if len(nft_txs) == 0:
+    if len(nft_utxos) == 0:
         return None
 
-    nft_txs = AssetTransaction.parse_obj(nft_txs[0])
+    pool_utxo = AddressUtxoContentItem.construct_trusted(nft_utxos[0])
 
-    return get_pool_in_tx(tx_hash=nft_txs.tx_hash)
+    check_valid_pool_output(pool_utxo)
+
+    return PoolState(
+        tx_hash=pool_utxo.tx_hash,
+        tx_index=pool_utxo.output_index,
+        assets=pool_utxo.amount,
+        datum_hash=pool_utxo.data_hash,
+    )
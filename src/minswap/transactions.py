@@ -31,6 +31,12 @@ TRANSACTION_CACHE_PATH.mkdir(exist_ok=True, parents=True)
 TRANSACTION_UTXO_CACHE_PATH = Path(__file__).parent.joinpath("data/utxos")
 TRANSACTION_UTXO_CACHE_PATH.mkdir(exist_ok=True, parents=True)
 
+# Largest number of pages requested at once while catching up on transactions
+MAX_CALL_BATCH = 4 * cpu_count()
+
+# Shared across calls so that caching many pools does not start and join threads
+_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="minswap-transactions")
+
 
 def get_transaction_cache(
     pool: Union[minswap.models.PoolState, str]
@@ -168,20 +174,17 @@ def cache_transactions(
             call_batch = 1
         else:
             # Calculate the mean transaction rate
-            time_period = (
-                filtered.block_time.values[-1].as_py()
-                - filtered.block_time.values[0].as_py()
-            ).total_seconds()
+            block_times = filtered.block_time.to_numpy()
+            one_second = numpy.timedelta64(1, "s")
+            time_period = (block_times[-1] - block_times[0]) / one_second
             n_transactions = len(filtered)
-            if time_period is None or time_period == 0:
+            if time_period == 0:
                 call_batch = 1
             else:
                 tps = n_transactions / time_period
 
                 # Estimate number of pages needed to update to the current time
-                time_delta = (
-                    datetime.utcnow() - filtered.block_time.values[-1].as_py()
-                ).total_seconds()
+                time_delta = (numpy.datetime64(now) - block_times[-1]) / one_second
                 call_batch = min(cpu_count(), int(time_delta * tps // 100))
 
         filtered.close()
@@ -191,8 +194,8 @@ def cache_transactions(
         page = 1
         call_batch = cpu_count()
 
-    if call_batch == 0:
-        call_batch = 1
+    # A local clock behind the last block time gives a negative estimate
+    call_batch = max(1, call_batch)
 
     logger.debug(f"start page: {page}")
 
@@ -205,54 +208,48 @@ def cache_transactions(
 
         return transactions
 
-    with ThreadPoolExecutor(call_batch) as executor:
-        done = False
-        num_calls = 0
-        transactions: List[minswap.models.PoolTransactionReference] = []
-        while not done and num_calls < max_calls:
-            # Exit if max_calls is reached
-            if num_calls + call_batch > max_calls:
-                call_batch = max_calls - num_calls
-
-            num_calls += call_batch
-            logger.debug(f"Calling page range: {page}-{page+call_batch}")
-
-            # Make the calls
-            threads = executor.map(
-                get_transaction_batch, range(page, page + call_batch)
-            )
-            for thread in threads:
-                if len(thread) != 100:
-                    done = True
-
-                    if len(thread) == 0:
-                        break
-
-                transactions.extend(thread)
-
-            # Store the data if all data for a month is collected
-            while (
-                len(transactions) > 0
-                and transactions[0].block_time.month
-                != transactions[-1].block_time.month
-            ):
-                logger.debug(
-                    "Caching transactions for "
-                    + f"{transactions[0].block_time.year}"
-                    + f"{str(transactions[0].block_time.month).zfill(2)}"
-                )
-                transactions = minswap.utils._cache_timestamp_data(
-                    transactions, cache_path
-                )
-            page += call_batch
-
-        if len(transactions) > 0:
-            logger.debug(
-                "Caching transactions for "
-                + f"{transactions[0].block_time.year}"
-                + f"{str(transactions[0].block_time.month).zfill(2)}"
-            )
-            minswap.utils._cache_timestamp_data(transactions, cache_path)
+    done = False
+    num_calls = 0
+    transactions: List[minswap.models.PoolTransactionReference] = []
+    while not done and num_calls < max_calls:
+        # Exit if max_calls is reached
+        if num_calls + call_batch > max_calls:
+            call_batch = max_calls - num_calls
+
+        num_calls += call_batch
+        logger.debug(f"Calling page range: {page}-{page+call_batch}")
+
+        # Make the calls
+        threads = _EXECUTOR.map(get_transaction_batch, range(page, page + call_batch))
+        for thread in threads:
+            if len(thread) != 100:
+                done = True
+
+                if len(thread) == 0:
+                    break
+
+            transactions.extend(thread)
+
+        # Store the data if all data for a month is collected
+        while len(transactions) > 0:
+            first_time = transactions[0].block_time
+            last_time = transactions[-1].block_time
+            if (first_time.year, first_time.month) == (last_time.year, last_time.month):
+                break
+
+            logger.debug(f"Caching transactions for {first_time:%Y%m}")
+            transactions = minswap.utils._cache_timestamp_data(transactions, cache_path)
+        page += call_batch
+
+        # Read further ahead while every page is full, and back off on a short page
+        if not done:
+            call_batch = min(2 * call_batch, MAX_CALL_BATCH)
+        else:
+            call_batch = max(1, call_batch // 2)
+
+    if len(transactions) > 0:
+        logger.debug(f"Caching transactions for {transactions[0].block_time:%Y%m}")
+        minswap.utils._cache_timestamp_data(transactions, cache_path)
 
     return num_calls
 
@@ -314,49 +311,48 @@ def cache_utxos(
     # Batching values
     last_index = min(max_calls, len(cache))
 
-    with ThreadPoolExecutor() as executor:
-        num_calls = 0
-        tx_utxos: List[pandas.DataFrame] = []
-
-        if progress:
-            with logging_redirect_tqdm():
-                if not isinstance(pool, str):
-                    ticker_a = minswap.assets.asset_ticker(pool.unit_a)
-                    ticker_b = minswap.assets.asset_ticker(pool.unit_b)
-                    desc = f"{ticker_a}/{ticker_b}"
-                else:
-                    desc = "Getting UTXOs"
-                for ts, df in tqdm(
-                    zip(
-                        cache.block_time.values[:last_index],
-                        executor.map(
-                            minswap.utils.get_utxo,
-                            cache.tx_hash.values[:last_index],
-                        ),
-                    ),
-                    total=last_index,
-                    leave=False,
-                    desc=desc,
-                    unit="tx",
-                ):
-                    df["block_time"] = ts.as_py()
-                    tx_utxos.append(df)
-        else:
-            for ts, df in zip(
-                cache.block_time.values[:last_index],
-                executor.map(minswap.utils.get_utxo, cache.tx_hash.values[:last_index]),
+    # Evaluate the columns once rather than once per loop
+    block_times = cache.block_time.to_numpy()[:last_index].astype("datetime64[s]")
+    tx_hashes = cache.tx_hash.to_numpy()[:last_index]
+
+    num_calls = 0
+    tx_utxos: List[pandas.DataFrame] = []
+
+    if progress:
+        with logging_redirect_tqdm():
+            if not isinstance(pool, str):
+                ticker_a = minswap.assets.asset_ticker(pool.unit_a)
+                ticker_b = minswap.assets.asset_ticker(pool.unit_b)
+                desc = f"{ticker_a}/{ticker_b}"
+            else:
+                desc = "Getting UTXOs"
+            for ts, df in tqdm(
+                zip(
+                    block_times,
+                    _EXECUTOR.map(minswap.utils.get_utxo, tx_hashes),
+                ),
+                total=last_index,
+                leave=False,
+                desc=desc,
+                unit="tx",
             ):
                 num_calls += 1
-                df["block_time"] = ts.as_py()
-                df["block_time"] = df.block_time.astype("datetime64[s]")
+                df["block_time"] = ts
                 tx_utxos.append(df)
-
-        while len(tx_utxos) > 0:
-            logger.debug(
-                "Caching transactions for "
-                + f"{tx_utxos[0].block_time[0].year}"
-                + f"{str(tx_utxos[0].block_time[0].month).zfill(2)}"
-            )
-            tx_utxos = minswap.utils._cache_timestamp_data(tx_utxos, cache_path)
+    else:
+        for ts, df in zip(
+            block_times, _EXECUTOR.map(minswap.utils.get_utxo, tx_hashes)
+        ):
+            num_calls += 1
+            df["block_time"] = ts
+            tx_utxos.append(df)
+
+    while len(tx_utxos) > 0:
+        logger.debug(
+            "Caching transactions for "
+            + f"{tx_utxos[0].block_time[0].year}"
+            + f"{str(tx_utxos[0].block_time[0].month).zfill(2)}"
+        )
+        tx_utxos = minswap.utils._cache_timestamp_data(tx_utxos, cache_path)
 
     return num_calls
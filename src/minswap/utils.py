@@ -5,9 +5,10 @@ import time
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 import blockfrost
+import numpy
 import pandas
 import vaex
 from dotenv import load_dotenv
@@ -186,6 +187,38 @@ def _get_cache(cache_path: Path, glob: str = CACHE_GLOB) -> Optional[vaex.DataFr
     return df
 
 
+def month_boundary(data: Sequence[Any], get_time: Callable[[Any], datetime]) -> int:
+    """Index of the first item that is not in the same month as the first item.
+
+    Items must be sorted by time. Months are compared in windows that double in size,
+    so only the items up to the boundary are converted rather than the whole list.
+
+    Args:
+        data: A list of items sorted by time.
+        get_time: Function returning the time of an item.
+
+    Returns:
+        The index of the month boundary, or `len(data)` if all items share a month.
+    """
+    first, last = get_time(data[0]), get_time(data[-1])
+    if (first.year, first.month) == (last.year, last.month):
+        return len(data)
+
+    first_month = numpy.datetime64(first, "M")
+    start, window = 1, 64
+    while start < len(data):
+        stop = min(start + window, len(data))
+        months = numpy.array(
+            [get_time(d) for d in data[start:stop]], dtype="datetime64[s]"
+        ).astype("datetime64[M]")
+        changes = numpy.flatnonzero(months != first_month)
+        if len(changes) > 0:
+            return start + int(changes[0])
+        start, window = stop, 2 * window
+
+    return len(data)
+
+
 def _cache_timestamp_data(
     data: Union[
         List[minswap.models.PoolTransactionReference],
@@ -219,26 +252,20 @@ def _cache_timestamp_data(
     if isinstance(
         data[0], (minswap.models.PoolTransactionReference, minswap.models.Transaction)
     ):
-        if data[0].block_time.month == data[-1].block_time.month:
-            index = len(data)
+        index = month_boundary(data, lambda d: d.block_time)
+        if isinstance(data[0], minswap.models.PoolTransactionReference):
+            # Flat model, so build the columns directly instead of a dict per row
+            df = pandas.DataFrame(
+                {
+                    name: [getattr(d, name) for d in data[:index]]
+                    for name in minswap.models.PoolTransactionReference.__fields__
+                }
+            )
         else:
-            for index in range(len(data) - 1):
-                if data[index].block_time.month != data[index + 1].block_time.month:
-                    index += 1
-                    break
-        df = pandas.DataFrame([d.dict() for d in data[:index]])
+            df = pandas.DataFrame([d.dict() for d in data[:index]])
     elif isinstance(data[0], pandas.DataFrame):
-        if data[0].block_time[0].month == data[-1].block_time[0].month:  # type: ignore
-            index = len(data)
-        else:
-            for index in range(len(data) - 1):
-                if (
-                    data[index].block_time[0].month  # type:ignore
-                    != data[index + 1].block_time[0].month  # type: ignore
-                ):
-                    index += 1
-                    break
-        df = pandas.concat(data, ignore_index=True)
+        index = month_boundary(data, lambda d: d.block_time[0])
+        df = pandas.concat(data[:index], ignore_index=True)
     else:
         raise TypeError(
             "Transactions should be one of [pydantic.BaseModel, pandas.DataFrame]"
@@ -255,28 +282,32 @@ def _cache_timestamp_data(
 
     # If the cache exists, append to it
     if path.exists():
-        cache_df = pandas.read_feather(path)
         tmp_path = path.with_name(path.name.replace(".arrow", "_temp.arrow"))
+
+        # Only read the column needed to find new rows
         if hash_filter:
-            unique_hashes = list(
-                set(df.hash.values.tolist()) - set(cache_df.hash.values.tolist())
-            )
-            filtered = df[df.hash.isin(unique_hashes)]
+            cached = pandas.read_feather(path, columns=["hash"])
+            filtered = df[~df.hash.isin(cached.hash.values)]
         else:
-            threshold = cache_df.block_time.astype("datetime64[s]").values[-1]
+            cached = pandas.read_feather(path, columns=["block_time"])
+            threshold = cached.block_time.astype("datetime64[s]").values[-1]
             filtered = df[df.block_time > threshold]
 
         logger.info(len(filtered))
         if len(filtered) > 0:
-            pandas.concat([cache_df, filtered], ignore_index=True).sort_values(
-                by="block_time"
-            ).reset_index(drop=True).to_feather(tmp_path)
+            cache_df = pandas.read_feather(path)
+            updated = pandas.concat([cache_df, filtered], ignore_index=True)
+
+            # Rows newer than the threshold already sort after the cached rows
+            if hash_filter:
+                updated = updated.sort_values(by="block_time").reset_index(drop=True)
+
+            updated.to_feather(tmp_path)
             path.unlink()
             tmp_path.rename(path)
 
     # Otherwise, just dump the whole dataframe to cache
     else:
-        df.sort_values(by="block_time", inplace=True)
         df.reset_index(drop=True, inplace=True)
         df.to_feather(path)
 
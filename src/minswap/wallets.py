@@ -198,10 +198,13 @@ class Wallet(BaseModel):
     @property
     def utxos(self) -> AddressUtxoContent:
         """Get the UTXOs of the wallet."""
-        utxos = AddressUtxoContent.parse_obj(
-            minswap.utils.BlockfrostBackend.api().address_utxos(
-                address=self.address.bech32, return_type="json"
-            )
+        raw_utxos = minswap.utils.BlockfrostBackend.api().address_utxos(
+            address=self.address.bech32, return_type="json"
+        )
+
+        # Blockfrost responses are trusted, so skip validation where possible
+        utxos = AddressUtxoContent.construct(
+            __root__=[AddressUtxoContentItem.construct_trusted(u) for u in raw_utxos]
         )
 
         return utxos
@@ -371,8 +374,8 @@ class Wallet(BaseModel):
         tx_builder = pycardano.TransactionBuilder(self.context, auxiliary_data=message)
         tx_builder.add_input_address(self.address.address)
 
-        in_assets.__root__["lovelace"] = (
-            in_assets["lovelace"] + order_datum.batcher_fee + order_datum.deposit
+        in_assets = in_assets + Assets(
+            lovelace=order_datum.batcher_fee + order_datum.deposit
         )
         tx_builder.add_output(
             pycardano.TransactionOutput(
@@ -470,15 +473,15 @@ class Wallet(BaseModel):
             if in_assets is not None:
                 message = self._msg(["Swap: Exact In", msg])
                 out_assets, _ = pool.get_amount_out(in_assets)
-                out_assets.__root__[out_assets.unit()] = int(
-                    out_assets.__root__[out_assets.unit()] * (1 - slippage)
+                out_assets = Assets(
+                    **{out_assets.unit(): int(out_assets.quantity() * (1 - slippage))}
                 )
                 step = SwapExactIn.from_assets(out_assets)
             elif out_assets is not None:
                 message = self._msg(["Swap: Exact Out", msg])
                 in_assets, _ = pool.get_amount_in(out_assets)
-                in_assets.__root__[in_assets.unit()] = int(
-                    in_assets.__root__[in_assets.unit()] * (1 + slippage)
+                in_assets = Assets(
+                    **{in_assets.unit(): int(in_assets.quantity() * (1 + slippage))}
                 )
                 step = SwapExactOut.from_assets(out_assets)
             else:
@@ -557,8 +560,8 @@ class Wallet(BaseModel):
         if len(assets) == 1:
             assert pool is not None
             asset_out, _ = pool.get_zap_in_lp(assets)
-            asset_out.__root__[pool.lp_token] = int(
-                asset_out[pool.lp_token] * (1 - slippage)
+            asset_out = Assets(
+                **{pool.lp_token: int(asset_out[pool.lp_token] * (1 - slippage))}
             )
             step = ZapIn.from_assets(asset_out)
             message = self._msg(["Deposit: Zap in", msg])
@@ -590,7 +593,7 @@ class Wallet(BaseModel):
             required_signers=[self.payment_verification_key.hash()],
         )
         for output in order.transaction.transaction_body.outputs:
-            if output.address.encode() == minswap.addr.STAKE_ORDER.address.encode():
+            if output.address.encode() == minswap.addr.STAKE_ORDER.bech32:
                 if output.datum_hash is None:
                     output.datum_hash = pycardano.datum_hash(output.datum)
                 t_in = pycardano.TransactionInput(order.transaction.id, 0)
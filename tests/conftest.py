@@ -1,10 +1,9 @@
+# noqa
 import blockfrost
-from dotenv import dotenv_values
 
+from minswap.utils import BlockfrostBackend
 
-def api():
 
-    env = dotenv_values()
-    api = blockfrost.BlockFrostApi(env["PROJECT_ID"])
+def api() -> blockfrost.BlockFrostApi:
 
-    return api
+    return BlockfrostBackend.api()
@@ -0,0 +1,57 @@
+from dataclasses import fields
+
+import pytest
+
+from minswap.models import Assets, SwapExactIn, SwapExactOut, ZapIn
+
+MIN = "29d222ce763455e3d7a09a665ce554f00ac89d2e99a1a83d267170c64d494e"
+
+
+def test_assets_sorted():
+    assets = Assets(**{MIN: 10, "lovelace": 5})
+
+    assert assets.unit(0) == "lovelace"
+    assert assets.unit(1) == MIN
+
+
+def test_assets_immutable():
+    assets = Assets(lovelace=5)
+
+    with pytest.raises(TypeError):
+        assets.__root__ = {"lovelace": 10}
+
+
+def test_assets_hashable():
+    a = Assets(**{MIN: 10, "lovelace": 5})
+    b = Assets(**{"lovelace": 5, MIN: 10})
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+    c = Assets.from_sorted({MIN: 10, "lovelace": 5})
+
+    assert a == c
+    assert hash(a) == hash(c)
+
+
+def test_assets_arithmetic():
+    a = Assets(**{MIN: 10, "lovelace": 5})
+    b = Assets(lovelace=2)
+
+    assert a + b == Assets(**{MIN: 10, "lovelace": 7})
+    assert b - a == Assets(**{MIN: -10, "lovelace": -3})
+
+    c = Assets.from_sorted({MIN: 10, "lovelace": 5}) + Assets(**{MIN: 1})
+
+    assert c.unit(0) == "lovelace"
+    assert c.unit(1) == MIN
+
+
+@pytest.mark.parametrize("datum", [SwapExactIn, SwapExactOut, ZapIn])
+def test_datum_from_assets(datum):
+    step = datum.from_assets(Assets(**{MIN: 10}))
+
+    assert step.desired_coin.policy == bytes.fromhex(MIN[:56])
+    assert step.desired_coin.asset_name == bytes.fromhex(MIN[56:])
+    assert getattr(step, fields(step)[1].name) == 10
@@ -1,6 +1,7 @@
 import pytest
 
-from minswap import pools
+from minswap import addr, pools
+from minswap.models import Assets
 
 test_pools = {
     "ADA-MIN": "6aa2153e1ae896a95539c9d62f76cedcdabdcdf144e564b8955f609d660cf6a2",
@@ -12,6 +13,71 @@ test_pools = {
     "ADA-HOSKY": "11e236a5a8826f3f8fbc1114df918b945b0b5d8f9c74bd383f96a0ea14bffade",
 }
 
+MIN = "29d222ce763455e3d7a09a665ce554f00ac89d2e99a1a83d267170c64d494e"
+
+
+def make_pool_state(pool_id: str, **assets: int) -> pools.PoolState:
+    pool_assets = Assets(
+        **assets,
+        **{
+            f"{addr.POOL_NFT_POLICY_ID}{pool_id}": 1,
+            addr.FACTORY_UNIT: 1,
+            f"{addr.LP_POLICY_ID}{pool_id}": 5,
+        },
+    )
+
+    return pools.PoolState(tx_hash="", tx_index=0, assets=pool_assets, datum_hash="")
+
+
+def test_translate_address():
+    pool_id = test_pools["ADA-MIN"]
+    pool_state = make_pool_state(pool_id, lovelace=1000, **{MIN: 2000})
+
+    assert pool_state.id == pool_id
+    assert pool_state.unit_a == "lovelace"
+    assert pool_state.unit_b == MIN
+    assert pool_state.reserve_a == 1000
+    assert pool_state.reserve_b == 2000
+    assert pool_state.lp_token not in pool_state.assets
+    assert addr.FACTORY_UNIT in pool_state.minswap_nft
+
+
+def test_translate_address_non_ada():
+    pool_id = test_pools["ADA-MIN"]
+    other = f"{addr.LP_POLICY_ID}{test_pools['ADA-LQ']}"
+    pool_state = make_pool_state(pool_id, lovelace=2, **{MIN: 2000, other: 3000})
+
+    # ADA is sent to the end for non-ADA pairs
+    assert pool_state.unit_a == MIN
+    assert pool_state.unit_b == other
+    assert pool_state.assets.unit(2) == "lovelace"
+
+
+@pytest.mark.parametrize("reserve", [1000, 10**15])
+def test_get_amount_out_batch(reserve: int):
+    pool_id = test_pools["ADA-MIN"]
+    pool_state = make_pool_state(pool_id, lovelace=reserve, **{MIN: 2 * reserve})
+    quantities = [1, 10, 500]
+
+    amounts, impacts = pool_state.get_amount_out_batch("lovelace", quantities)
+
+    for quantity, amount, impact in zip(quantities, amounts, impacts):
+        expected, expected_impact = pool_state.get_amount_out(Assets(lovelace=quantity))
+        assert amount == expected.quantity()
+        assert impact == pytest.approx(expected_impact)
+
+
+@pytest.mark.parametrize("unit", ["lovelace", MIN])
+def test_get_amount_in(unit: str):
+    pool_id = test_pools["ADA-MIN"]
+    pool_state = make_pool_state(pool_id, lovelace=10**12, **{MIN: 2 * 10**12})
+
+    amount_out, _ = pool_state.get_amount_out(Assets(**{unit: 10**6}))
+    amount_in, _ = pool_state.get_amount_in(amount_out)
+
+    assert amount_in.unit() == unit
+    assert amount_in.quantity() == pytest.approx(10**6, abs=2)
+
 
 @pytest.mark.parametrize("return_non_pools", [True, False])
 def test_get_pools(return_non_pools: bool):
@@ -33,6 +99,9 @@ def test_price(pool: str, pool_id: str):
 
     print(f"{pool}: {pool_state.price}")
 
+    for price, price_float in zip(pool_state.price, pool_state.price_float):
+        assert price_float == pytest.approx(float(price))
+
 
 @pytest.mark.parametrize(("pool", "pool_id"), list(test_pools.items()))
 def test_tvl(pool: str, pool_id: str):